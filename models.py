@@ -1,8 +1,18 @@
+import queue
+import sys
+from collections import OrderedDict
+
 import boto3
 
-from utils import ExceptionCatchingThread, RDSWaiter
+from utils import (
+    ExceptionCatchingThread,
+    RDSWaiter,
+    ThrottlingMonitor,
+    parse_engine_version,
+)
 
 rds_client = boto3.client("rds")
+throttling_monitor = ThrottlingMonitor(rds_client)
 
 
 class RDSInstance:
@@ -10,8 +20,19 @@ class RDSInstance:
 
     SUPPORTED_ENGINES = ["postgres", "mysql"]
 
-    def __init__(self, db_instance_id, target_version=None):
+    # Engines for which RDS upgrades in-region read replicas along with their
+    # source DB instance, so replicas must not be modified directly.
+    # See: https://amzn.to/2IdKOel
+    ENGINES_UPGRADING_READ_REPLICAS_WITH_SOURCE = ["postgres"]
+
+    def __init__(self, db_instance_id, target_version=None,
+                 db_engine_versions=None):
         self.target_version = target_version
+        # describe_db_engine_versions responses keyed by (engine, version),
+        # possibly shared amongst many RDSInstances
+        self.db_engine_versions = (
+            {} if db_engine_versions is None else db_engine_versions
+        )
         self.db_instance_id = db_instance_id
         self.db_instance_data = self._get_db_instance_data()
         self.engine = self.db_instance_data["Engine"]
@@ -38,6 +59,34 @@ class RDSInstance:
     def engine_version(self):
         return self._get_db_instance_data()["EngineVersion"]
 
+    @property
+    def read_replica_source_id(self):
+        """
+        :return: DBInstanceIdentifier of the DB Instance this one is a read
+        replica of, or None if it isn't a read replica
+
+        >>> from test_data.utils import make_rds_instance
+        >>> make_rds_instance().read_replica_source_id is None
+        True
+        """
+        return self.db_instance_data.get("ReadReplicaSourceDBInstanceIdentifier")
+
+    @property
+    def read_replica_ids(self):
+        """
+        :return: list of DBInstanceIdentifiers of this DB Instance's read
+        replicas
+
+        >>> from test_data.utils import make_rds_instance
+        >>> make_rds_instance().read_replica_ids
+        []
+        """
+        return self.db_instance_data.get("ReadReplicaDBInstanceIdentifiers", [])
+
+    @property
+    def upgrades_read_replicas_with_source(self):
+        return self.engine in self.ENGINES_UPGRADING_READ_REPLICAS_WITH_SOURCE
+
     @property
     def is_upgradable(self):
         """
@@ -92,9 +141,7 @@ class RDSInstance:
         if major_version_upgrades is None:
             major_version_upgrades = []
 
-        db_engine_versions = rds_client.describe_db_engine_versions(
-            Engine=self.engine, EngineVersion=engine_version
-        )["DBEngineVersions"]
+        db_engine_versions = self._describe_db_engine_versions(engine_version)
 
         for db_engine_version in db_engine_versions:
             available_major_versions = [
@@ -123,23 +170,44 @@ class RDSInstance:
                     major_version_upgrades=major_version_upgrades,
                 )  # recursive call
 
+    def _describe_db_engine_versions(self, engine_version):
+        """
+        Fetch the DBEngineVersions for the given engine version, only
+        hitting the AWS API the first time a given version is asked for
+        :param engine_version: str
+        :return: list of DBEngineVersions
+        """
+        key = (self.engine, engine_version)
+        if key not in self.db_engine_versions:
+            self.db_engine_versions[key] = rds_client.describe_db_engine_versions(
+                Engine=self.engine, EngineVersion=engine_version
+            )["DBEngineVersions"]
+        return self.db_engine_versions[key]
+
     def _modify_db(self):
         """
         Perform a major version upgrade (modify_db_instance) for each available
-         major postgres engine version in our self.upgrade_path.
+         major engine version in our self.upgrade_path.
 
         Note: The RDSWaiter is crucial in this method as it will
         ensure that the corresponding AWS RDS Instances are in a state of
         availability before attempting to modify them.
         """
-        for pg_engine_version in self.upgrade_path:
-            with RDSWaiter(rds_client, self.db_instance_id, pg_engine_version):
-                rds_client.modify_db_instance(
-                    DBInstanceIdentifier=self.db_instance_id,
-                    EngineVersion=pg_engine_version,
-                    AllowMajorVersionUpgrade=True,
-                    ApplyImmediately=True,
-                )
+        for engine_version in self.upgrade_path:
+            self._modify_db_to(engine_version)
+
+    def _modify_db_to(self, engine_version):
+        """
+        Perform a single major version upgrade hop to the given engine version
+        :param engine_version: str
+        """
+        with RDSWaiter(rds_client, self.db_instance_id, engine_version):
+            rds_client.modify_db_instance(
+                DBInstanceIdentifier=self.db_instance_id,
+                EngineVersion=engine_version,
+                AllowMajorVersionUpgrade=True,
+                ApplyImmediately=True,
+            )
 
     def upgrade(self):
         """
@@ -181,17 +249,32 @@ class RDSUpgrader:
     (RDSInstance.is_upgradable)
     """
 
+    # Throttled API requests tolerated per replica set in flight before the
+    # upgrade concurrency is scaled back
+    MAX_THROTTLES_PER_UPGRADE = 1
+
     def __init__(self, ids=None, tags=None, target_version=None):
         if tags is not None:
             ids = self._get_db_instance_ids_from_tags(tags)
+        db_engine_versions = {}
         self.rds_instances = [
             instance
             for instance in [
-                RDSInstance(db_instance_id, target_version=target_version)
+                RDSInstance(
+                    db_instance_id,
+                    target_version=target_version,
+                    db_engine_versions=db_engine_versions,
+                )
                 for db_instance_id in ids
             ]
             if instance.is_upgradable
         ]
+        self.rds_instances = self._exclude_read_replicas_upgraded_with_source(
+            self.rds_instances
+        )
+        self.rds_instances = self._exclude_sources_of_unscheduled_read_replicas(
+            self.rds_instances
+        )
 
     def _get_db_instance_ids_from_tags(self, tags):
         """
@@ -219,24 +302,526 @@ class RDSUpgrader:
             print("No instances found matching tags: {}".format(tags))
         return list(matching_instance_ids)
 
+    @staticmethod
+    def _get_upgrade_group_key(rds_instance):
+        return (
+            rds_instance.engine,
+            rds_instance.db_instance_data["EngineVersion"],
+            tuple(rds_instance.upgrade_path),
+        )
+
+    def _get_upgrade_groups(self, rds_instances):
+        """
+        Group RDSInstances sharing an identical upgrade path
+        :param rds_instances: list of RDSInstances
+        :return: OrderedDict of (engine, engine_version, upgrade_path) ->
+        list of RDSInstances, in order of first appearance
+
+        >>> from test_data.utils import make_rds_upgrader
+        >>> rds_upgrader = make_rds_upgrader()
+        >>> upgrade_groups = rds_upgrader._get_upgrade_groups(
+        ...    rds_upgrader.rds_instances)
+        >>> for upgrade_group_key, rds_instances in upgrade_groups.items():
+        ...    print(upgrade_group_key,
+        ...          [rds_instance.db_instance_id for rds_instance in rds_instances])
+        ('postgres', '9.3.14', ('9.4.18', '9.5.13', '9.6.9', '10.4')) ['test-rds-id']
+        """
+        upgrade_groups = OrderedDict()
+        for rds_instance in rds_instances:
+            upgrade_groups.setdefault(
+                self._get_upgrade_group_key(rds_instance), []
+            ).append(rds_instance)
+        return upgrade_groups
+
+    def _validate_upgrade_path(self, engine, engine_version, upgrade_path):
+        """
+        Check with the AWS API that each hop of an upgrade path is still a
+        valid upgrade target of the previous one, as engine versions may have
+        been deprecated since the upgrade path was planned
+        :raises: ValueError on the first invalid hop
+        """
+        for upgrade_target in upgrade_path:
+            valid_upgrade_targets = [
+                valid_upgrade_target["EngineVersion"]
+                for db_engine_version in rds_client.describe_db_engine_versions(
+                    Engine=engine, EngineVersion=engine_version
+                )["DBEngineVersions"]
+                for valid_upgrade_target in db_engine_version["ValidUpgradeTarget"]
+            ]
+            if upgrade_target not in valid_upgrade_targets:
+                raise ValueError(
+                    "{} is not a valid upgrade target for {} {}".format(
+                        upgrade_target, engine, engine_version
+                    )
+                )
+            engine_version = upgrade_target
+
     def get_dry_run_info(self):
         """
-        Construct and return a string containing rds_instances db_instnace_ids
-        and their corresponding upgrade paths
+        Construct and return a string summarizing the upgrade paths to be
+        taken and the rds_instances db_instance_ids sharing each of them
 
-        Ex: RDSInstance: fake-postgres will be upgraded as follows: 9.4.19 -> 9.5.14 -> 9.6.10 -> 10.5
+        Ex: postgres 9.3.14 -> 9.4.19 -> 9.5.14 -> 9.6.10 -> 10.5: 2 RDSInstance(s) (fake-postgres-a, fake-postgres-b)
         """
         dry_run_info = ""
-        for rds_instance in self.rds_instances:
-            dry_run_info += (
-                "RDSInstance: {} will be upgraded as follows: {}\n".format(
-                    rds_instance.db_instance_id,
-                    " -> ".join(rds_instance.upgrade_path)
-                )
+        upgrade_groups = self._get_upgrade_groups(self.rds_instances)
+        for (engine, engine_version, upgrade_path), rds_instances in (
+            upgrade_groups.items()
+        ):
+            dry_run_info += "{} {}: {} RDSInstance(s) ({})\n".format(
+                engine,
+                " -> ".join((engine_version,) + upgrade_path),
+                len(rds_instances),
+                ", ".join(
+                    rds_instance.db_instance_id for rds_instance in rds_instances
+                ),
             )
         return dry_run_info
 
-    def upgrade_all(self):
-        for rds_instance in self.rds_instances:
-            upgrade_thread = rds_instance.upgrade()
-            upgrade_thread.join()
+    def _exclude_read_replicas_upgraded_with_source(self, rds_instances):
+        """
+        Exclude read replicas that RDS upgrades along with their source DB
+        Instance (see RDSInstance.upgrades_read_replicas_with_source), as
+        they can't be upgraded on their own
+        :param rds_instances: list of RDSInstances
+        :return: list of RDSInstances
+        """
+        included_instances = []
+        for rds_instance in rds_instances:
+            if (rds_instance.upgrades_read_replicas_with_source and
+                    rds_instance.read_replica_source_id is not None):
+                print(
+                    "Excluding DB instance: {} as it is a read replica of: {} "
+                    "and is upgraded along with it".format(
+                        rds_instance.db_instance_id,
+                        rds_instance.read_replica_source_id,
+                    )
+                )
+            else:
+                included_instances.append(rds_instance)
+        return included_instances
+
+    def _exclude_sources_of_unscheduled_read_replicas(self, rds_instances):
+        """
+        Exclude DB Instances whose read replicas have to be upgraded before
+        them (see RDSInstance.upgrades_read_replicas_with_source) but aren't
+        going to be upgraded. Upgrading such a source would leave it on a
+        newer engine version than the read replicas it replicates to.
+        Read replicas already at or past the source's target engine version
+        don't need upgrading, and so don't hold their source back.
+        :param rds_instances: list of RDSInstances
+        :return: list of RDSInstances
+        """
+        read_replica_engine_versions = {}
+
+        def is_up_to_date(read_replica_id, source_instance):
+            if not source_instance.upgrade_path:
+                return True
+            if read_replica_id not in read_replica_engine_versions:
+                read_replica_engine_versions[read_replica_id] = (
+                    rds_client.describe_db_instances(
+                        DBInstanceIdentifier=read_replica_id
+                    )["DBInstances"][0]["EngineVersion"]
+                )
+            return parse_engine_version(
+                read_replica_engine_versions[read_replica_id]
+            ) >= parse_engine_version(source_instance.upgrade_path[-1])
+
+        while True:
+            scheduled_instance_ids = set(
+                rds_instance.db_instance_id for rds_instance in rds_instances
+            )
+            excluded_instances = []
+            for rds_instance in rds_instances:
+                if rds_instance.upgrades_read_replicas_with_source:
+                    continue
+                unscheduled_read_replica_ids = [
+                    read_replica_id
+                    for read_replica_id in rds_instance.read_replica_ids
+                    if read_replica_id not in scheduled_instance_ids and
+                    not is_up_to_date(read_replica_id, rds_instance)
+                ]
+                if unscheduled_read_replica_ids:
+                    print(
+                        "Excluding DB instance: {} as its read replicas: {} "
+                        "are not being upgraded along with it".format(
+                            rds_instance.db_instance_id,
+                            unscheduled_read_replica_ids,
+                        )
+                    )
+                    excluded_instances.append(rds_instance)
+            if not excluded_instances:
+                return rds_instances
+            # Excluding a read replica may leave its own source behind, so
+            # keep going until nothing else gets excluded
+            rds_instances = [
+                rds_instance
+                for rds_instance in rds_instances
+                if rds_instance not in excluded_instances
+            ]
+
+    def _get_read_replica_sets(self):
+        """
+        Build the replication topology (a DAG of source DB Instances to their
+        read replicas) of our rds_instances from the describe data.
+        Read replicas whose source isn't being upgraded are treated as
+        sources of their own replica set.
+        :return: tuple of (list of root RDSInstances,
+        dict of db_instance_id -> list of read replica RDSInstances)
+
+        >>> from test_data.utils import make_rds_upgrader
+        >>> rds_upgrader = make_rds_upgrader()
+        >>> roots, read_replicas = rds_upgrader._get_read_replica_sets()
+        >>> [rds_instance.db_instance_id for rds_instance in roots]
+        ['test-rds-id']
+        >>> read_replicas
+        {'test-rds-id': []}
+        """
+        rds_instances_by_id = {
+            rds_instance.db_instance_id: rds_instance
+            for rds_instance in self.rds_instances
+        }
+        read_replicas = {
+            rds_instance.db_instance_id: [
+                rds_instances_by_id[read_replica_id]
+                for read_replica_id in rds_instance.read_replica_ids
+                if read_replica_id in rds_instances_by_id
+            ]
+            for rds_instance in self.rds_instances
+        }
+        roots = [
+            rds_instance
+            for rds_instance in self.rds_instances
+            if rds_instance.read_replica_source_id not in rds_instances_by_id
+        ]
+        return roots, read_replicas
+
+    def _upgrade_read_replica_set(self, rds_instance, read_replicas):
+        """
+        Walk a source DB Instance through its upgrade_path one hop at a time,
+        upgrading its read replicas to each hop before the source itself
+        :param rds_instance: root RDSInstance of the replica set
+        :param read_replicas: dict of db_instance_id -> list of read replica
+        RDSInstances
+        """
+        for engine_version in rds_instance.upgrade_path:
+            self._upgrade_read_replica_set_to(
+                rds_instance, read_replicas, engine_version
+            )
+
+    def _upgrade_read_replica_set_to(self, rds_instance, read_replicas,
+                                     engine_version):
+        """
+        Upgrade a DB Instance and (recursively) its read replicas to the given
+        engine version. Sibling read replicas are upgraded concurrently, and
+        all of them have to finish before their source is upgraded.
+
+        Read replicas already past the given engine version are skipped, as
+        are those RDS upgrades along with their source. A source is left
+        alone if any of its read replicas failed to upgrade.
+        """
+        if not rds_instance.upgrades_read_replicas_with_source:
+            replica_threads = [
+                ExceptionCatchingThread(
+                    target=self._upgrade_read_replica_set_to,
+                    args=(read_replica, read_replicas, engine_version),
+                )
+                for read_replica in read_replicas[rds_instance.db_instance_id]
+            ]
+            for replica_thread in replica_threads:
+                replica_thread.start()
+            for replica_thread in replica_threads:
+                replica_thread.join()
+            for replica_thread in replica_threads:
+                if replica_thread.exception is not None:
+                    raise RuntimeError(
+                        "Not upgrading {} to: {} as one of its read replicas "
+                        "failed to upgrade".format(
+                            rds_instance.db_instance_id, engine_version
+                        )
+                    )
+
+        if engine_version in rds_instance.upgrade_path:
+            rds_instance._modify_db_to(engine_version)
+
+    def _get_waves(self, roots, wave_tags=None):
+        """
+        Split the replica sets to be upgraded into waves. Each wave is made
+        up of the replica sets whose source DB Instance matches the
+        respective tags in wave_tags, and any replica sets left over make up
+        a final wave.
+        :param roots: list of root RDSInstances of each replica set
+        :param wave_tags: list of dicts containing AWS tags
+        :return: list of lists of root RDSInstances
+
+        >>> from test_data.utils import make_rds_upgrader
+        >>> rds_upgrader = make_rds_upgrader()
+        >>> [[rds_instance.db_instance_id for rds_instance in wave]
+        ...    for wave in rds_upgrader._get_waves(rds_upgrader.rds_instances)]
+        [['test-rds-id']]
+        """
+        waves = []
+        remaining_roots = list(roots)
+        for tags in wave_tags or []:
+            wave_instance_ids = self._get_db_instance_ids_from_tags(tags)
+            wave = [
+                rds_instance
+                for rds_instance in remaining_roots
+                if rds_instance.db_instance_id in wave_instance_ids
+            ]
+            remaining_roots = [
+                rds_instance
+                for rds_instance in remaining_roots
+                if rds_instance not in wave
+            ]
+            if wave:
+                waves.append(wave)
+        if remaining_roots:
+            waves.append(remaining_roots)
+        return waves
+
+    def _get_next_concurrency(self, concurrency, failed, throttles, in_flight,
+                              max_concurrency=None):
+        """
+        Adapt the number of replica sets to keep upgrading concurrently as
+        each of them finishes: halve it if the upgrade failed or AWS
+        throttled our requests more than MAX_THROTTLES_PER_UPGRADE times per
+        replica set in flight since the previous one finished, otherwise
+        grow it by one (doubling it over a full window of successes).
+
+        >>> from test_data.utils import make_rds_upgrader
+        >>> rds_upgrader = make_rds_upgrader()
+        >>> rds_upgrader._get_next_concurrency(2, failed=False, throttles=0,
+        ...    in_flight=2)
+        3
+        >>> rds_upgrader._get_next_concurrency(6, failed=False, throttles=0,
+        ...    in_flight=6, max_concurrency=6)
+        6
+        >>> rds_upgrader._get_next_concurrency(4, failed=True, throttles=0,
+        ...    in_flight=4)
+        2
+        >>> rds_upgrader._get_next_concurrency(4, failed=False, throttles=9,
+        ...    in_flight=4)
+        2
+        >>> rds_upgrader._get_next_concurrency(1, failed=True, throttles=0,
+        ...    in_flight=1)
+        1
+        """
+        if failed or throttles > in_flight * self.MAX_THROTTLES_PER_UPGRADE:
+            return max(1, concurrency // 2)
+        concurrency += 1
+        if max_concurrency is not None:
+            concurrency = min(concurrency, max_concurrency)
+        return concurrency
+
+    def _get_read_replica_set_hops(self, rds_instance, read_replicas,
+                                   upgrade_path=None):
+        """
+        Gather the hops each DB Instance of a replica set will be upgraded
+        through: the root's upgrade_path, and for each read replica the hops
+        of its source's upgrade_path that are also in its own
+        (see _upgrade_read_replica_set_to)
+        :param rds_instance: root RDSInstance of the replica set
+        :param read_replicas: dict of db_instance_id -> list of read replica
+        RDSInstances
+        :return: list of (RDSInstance, list of engine versions) tuples
+        """
+        if upgrade_path is None:
+            upgrade_path = rds_instance.upgrade_path
+        read_replica_set_hops = [
+            (
+                rds_instance,
+                [
+                    engine_version
+                    for engine_version in upgrade_path
+                    if engine_version in rds_instance.upgrade_path
+                ],
+            )
+        ]
+        if not rds_instance.upgrades_read_replicas_with_source:
+            for read_replica in read_replicas[rds_instance.db_instance_id]:
+                read_replica_set_hops.extend(
+                    self._get_read_replica_set_hops(
+                        read_replica, read_replicas, upgrade_path=upgrade_path
+                    )
+                )
+        return read_replica_set_hops
+
+    def _upgrade_wave(self, wave, read_replicas, concurrency=None,
+                      max_concurrency=None):
+        """
+        Upgrade the replica sets of a wave. The DB Instances (read replicas
+        included) of the wave that will go through identical hops from the
+        same engine version form an upgrade group, whose hops are validated
+        once. Replica sets with any DB Instance in an invalid group are left
+        alone. The remaining replica sets are then upgraded together, grouped
+        by their source's upgrade path, sharing the same adaptive
+        concurrency.
+        :return: whether the wave's canary batch failed
+        """
+        scheduled_upgrade_groups = OrderedDict()
+        for root in wave:
+            for rds_instance, hops in self._get_read_replica_set_hops(
+                root, read_replicas
+            ):
+                scheduled_upgrade_groups.setdefault(
+                    (
+                        rds_instance.engine,
+                        rds_instance.db_instance_data["EngineVersion"],
+                        tuple(hops),
+                    ),
+                    [],
+                ).append(root)
+
+        invalid_roots = []
+        for (engine, engine_version, hops), roots in (
+            scheduled_upgrade_groups.items()
+        ):
+            try:
+                self._validate_upgrade_path(engine, engine_version, hops)
+            except ValueError as exc:
+                print(
+                    "Not upgrading: {} as {}".format(
+                        [rds_instance.db_instance_id for rds_instance in roots],
+                        exc,
+                    ),
+                    file=sys.stderr,
+                )
+                invalid_roots.extend(roots)
+
+        roots_to_upgrade = []
+        for (engine, engine_version, upgrade_path), roots in (
+            self._get_upgrade_groups(wave).items()
+        ):
+            roots = [
+                rds_instance
+                for rds_instance in roots
+                if rds_instance not in invalid_roots
+            ]
+            if not roots:
+                continue
+            print(
+                "Upgrading {} RDSInstance(s) as follows: {}".format(
+                    len(roots), " -> ".join((engine_version,) + upgrade_path)
+                )
+            )
+            roots_to_upgrade.extend(roots)
+        return self._upgrade_with_adaptive_concurrency(
+            roots_to_upgrade,
+            read_replicas,
+            concurrency=concurrency,
+            max_concurrency=max_concurrency,
+        )
+
+    def _upgrade_read_replica_set_and_report(self, rds_instance,
+                                             read_replicas, finished):
+        """
+        Run _upgrade_read_replica_set, then put the root RDSInstance and the
+        exception it raised (if any) on the `finished` Queue
+        """
+        exception = None
+        try:
+            self._upgrade_read_replica_set(rds_instance, read_replicas)
+        except Exception as exc:
+            exception = exc
+            raise
+        finally:
+            finished.put((rds_instance, exception))
+
+    def _upgrade_with_adaptive_concurrency(self, roots, read_replicas,
+                                           concurrency=None,
+                                           max_concurrency=None):
+        """
+        Upgrade replica sets while keeping up to `concurrency` of them in
+        flight: another one is started as soon as one finishes, and the
+        concurrency is adapted every time one finishes.
+
+        The first `concurrency` replica sets are a canary: no other replica
+        sets are started until all of them have finished, and none at all if
+        any of them failed. Without a concurrency, all replica sets are
+        started at once.
+        :return: whether the canary failed
+        """
+        pending_roots = list(roots)
+        canary_size = min(concurrency or len(pending_roots), len(pending_roots))
+        canary_failures = 0
+        started = finished_count = 0
+        finished = queue.Queue()
+        throttles_before = throttling_monitor.count
+
+        while pending_roots or started > finished_count:
+            in_canary = finished_count < canary_size
+            while pending_roots and (
+                started < canary_size if in_canary
+                else started - finished_count < concurrency
+            ):
+                ExceptionCatchingThread(
+                    target=self._upgrade_read_replica_set_and_report,
+                    args=(pending_roots.pop(0), read_replicas, finished),
+                ).start()
+                started += 1
+
+            _, exception = finished.get()
+            finished_count += 1
+            if in_canary and exception is not None:
+                canary_failures += 1
+            if finished_count == canary_size and canary_failures:
+                print(
+                    "Halting the rollout as {} of the {} canary upgrade(s) "
+                    "failed".format(canary_failures, canary_size),
+                    file=sys.stderr,
+                )
+                return True
+
+            if concurrency is not None:
+                throttles = throttling_monitor.count - throttles_before
+                throttles_before = throttling_monitor.count
+                concurrency = self._get_next_concurrency(
+                    concurrency,
+                    failed=exception is not None,
+                    throttles=throttles,
+                    in_flight=started - finished_count + 1,
+                    max_concurrency=max_concurrency,
+                )
+                print("Upgrade concurrency is now: {}".format(concurrency))
+        return False
+
+    def upgrade_all(self, wave_tags=None, concurrency=None,
+                    max_concurrency=None):
+        """
+        Upgrade all of our rds_instances. Independent replica sets are
+        upgraded in parallel, each within its own Thread.
+
+        :param wave_tags: list of dicts containing AWS tags, each selecting
+        the DB Instances to upgrade in a wave. Waves are upgraded one after
+        another, followed by any DB Instances not matching any of them.
+        :param concurrency: number of replica sets to upgrade in the first
+        (canary) batch of each wave. Within a wave, a new replica set is
+        started whenever one finishes; the concurrency grows by one with
+        each successful upgrade (doubling over a full window of them) and is
+        halved after failures or heavy API throttling. Every wave starts
+        over from this concurrency. All replica sets of a wave are upgraded
+        at once if not specified.
+        :param max_concurrency: upper bound for the adaptive concurrency
+
+        If any upgrade of a wave's canary batch fails, the rollout is halted:
+        neither the rest of that wave nor any later waves are upgraded.
+        """
+        for value in [concurrency, max_concurrency]:
+            if value is not None and value < 1:
+                raise ValueError(
+                    "Upgrade concurrency must be positive, got: {}".format(value)
+                )
+        if concurrency is not None and max_concurrency is not None:
+            concurrency = min(concurrency, max_concurrency)
+
+        roots, read_replicas = self._get_read_replica_sets()
+        for wave in self._get_waves(roots, wave_tags):
+            canary_failed = self._upgrade_wave(
+                wave,
+                read_replicas,
+                concurrency=concurrency,
+                max_concurrency=max_concurrency,
+            )
+            if canary_failed:
+                return
@@ -37,6 +37,16 @@ describe_mysql_db_engine_versions = [
 {'DBEngineVersions': [{'Engine': 'mysql', 'EngineVersion': '5.5.46', 'DBParameterGroupFamily': 'mysql5.5', 'DBEngineDescription': 'MySQL Community Edition', 'DBEngineVersionDescription': 'MySQL 5.5.46', 'ValidUpgradeTarget': [{'Engine': 'mysql', 'EngineVersion': '5.5.53', 'Description': 'MySQL 5.5.53', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.5.54', 'Description': 'MySQL 5.5.54', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.5.57', 'Description': 'MySQL 5.5.57', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.5.59', 'Description': 'MySQL 5.5.59', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.6.27', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.29', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.34', 'Description': 'MySQL 5.6.34', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.35', 'Description': 'MySQL 5.6.35', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.37', 'Description': 'MySQL 5.6.37', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.39', 'Description': 'MySQL 5.6.39', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.40', 'Description': 'MySQL 5.6.40', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}], 'SupportsLogExportsToCloudwatchLogs': False, 'SupportsReadReplica': True}, {'Engine': 'mysql', 'EngineVersion': '5.5.53', 'DBParameterGroupFamily': 'mysql5.5', 'DBEngineDescription': 'MySQL Community Edition', 'DBEngineVersionDescription': 'MySQL 5.5.53', 'ValidUpgradeTarget': [{'Engine': 'mysql', 'EngineVersion': '5.5.54', 'Description': 'MySQL 5.5.54', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.5.57', 'Description': 'MySQL 5.5.57', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.5.59', 'Description': 'MySQL 5.5.59', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.6.27', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.29', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.34', 'Description': 'MySQL 5.6.34', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.35', 'Description': 'MySQL 5.6.35', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.37', 'Description': 'MySQL 5.6.37', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.39', 'Description': 'MySQL 5.6.39', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.40', 'Description': 'MySQL 5.6.40', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}], 'SupportsLogExportsToCloudwatchLogs': False, 'SupportsReadReplica': True}, {'Engine': 'mysql', 'EngineVersion': '5.5.54', 'DBParameterGroupFamily': 'mysql5.5', 'DBEngineDescription': 'MySQL Community Edition', 'DBEngineVersionDescription': 'MySQL 5.5.54', 'ValidUpgradeTarget': [{'Engine': 'mysql', 'EngineVersion': '5.5.57', 'Description': 'MySQL 5.5.57', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.5.59', 'Description': 'MySQL 5.5.59', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.6.27', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.29', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.34', 'Description': 'MySQL 5.6.34', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.35', 'Description': 'MySQL 5.6.35', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.37', 'Description': 'MySQL 5.6.37', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.39', 'Description': 'MySQL 5.6.39', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.40', 'Description': 'MySQL 5.6.40', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}], 'SupportsLogExportsToCloudwatchLogs': False, 'SupportsReadReplica': True}, {'Engine': 'mysql', 'EngineVersion': '5.5.57', 'DBParameterGroupFamily': 'mysql5.5', 'DBEngineDescription': 'MySQL Community Edition', 'DBEngineVersionDescription': 'mysql 5.5.57', 'ValidUpgradeTarget': [{'Engine': 'mysql', 'EngineVersion': '5.5.59', 'Description': 'MySQL 5.5.59', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.6.27', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.29', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.34', 'Description': 'MySQL 5.6.34', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.35', 'Description': 'MySQL 5.6.35', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.37', 'Description': 'MySQL 5.6.37', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.39', 'Description': 'MySQL 5.6.39', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.40', 'Description': 'MySQL 5.6.40', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}], 'SupportsLogExportsToCloudwatchLogs': False, 'SupportsReadReplica': True}, {'Engine': 'mysql', 'EngineVersion': '5.5.59', 'DBParameterGroupFamily': 'mysql5.5', 'DBEngineDescription': 'MySQL Community Edition', 'DBEngineVersionDescription': 'mysql 5.5.59', 'ValidUpgradeTarget': [{'Engine': 'mysql', 'EngineVersion': '5.6.27', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.29', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.34', 'Description': 'MySQL 5.6.34', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.35', 'Description': 'MySQL 5.6.35', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.37', 'Description': 'MySQL 5.6.37', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.39', 'Description': 'MySQL 5.6.39', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.40', 'Description': 'MySQL 5.6.40', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}], 'SupportsLogExportsToCloudwatchLogs': False, 'SupportsReadReplica': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.27', 'DBParameterGroupFamily': 'mysql5.6', 'DBEngineDescription': 'MySQL Community Edition', 'DBEngineVersionDescription': 'MySQL 5.6.27', 'ValidUpgradeTarget': [{'Engine': 'mysql', 'EngineVersion': '5.6.34', 'Description': 'MySQL 5.6.34', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.6.35', 'Description': 'MySQL 5.6.35', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.6.37', 'Description': 'MySQL 5.6.37', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.6.39', 'Description': 'MySQL 5.6.39', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.6.40', 'Description': 'MySQL 5.6.40', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.7.16', 'Description': 'MySQL 5.7.16', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.17', 'Description': 'MySQL 5.7.17', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.19', 'Description': 'MySQL 5.7.19', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.21', 'Description': 'MySQL 5.7.21', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.22', 'Description': 'MySQL 5.7.22', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}], 'ExportableLogTypes': ['audit', 'error', 'general', 'slowquery'], 'SupportsLogExportsToCloudwatchLogs': True, 'SupportsReadReplica': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.29', 'DBParameterGroupFamily': 'mysql5.6', 'DBEngineDescription': 'MySQL Community Edition', 'DBEngineVersionDescription': 'MySQL 5.6.29', 'ValidUpgradeTarget': [{'Engine': 'mysql', 'EngineVersion': '5.6.34', 'Description': 'MySQL 5.6.34', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.6.35', 'Description': 'MySQL 5.6.35', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.6.37', 'Description': 'MySQL 5.6.37', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.6.39', 'Description': 'MySQL 5.6.39', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.6.40', 'Description': 'MySQL 5.6.40', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.7.16', 'Description': 'MySQL 5.7.16', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.17', 'Description': 'MySQL 5.7.17', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.19', 'Description': 'MySQL 5.7.19', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.21', 'Description': 'MySQL 5.7.21', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.22', 'Description': 'MySQL 5.7.22', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}], 'ExportableLogTypes': ['audit', 'error', 'general', 'slowquery'], 'SupportsLogExportsToCloudwatchLogs': True, 'SupportsReadReplica': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.34', 'DBParameterGroupFamily': 'mysql5.6', 'DBEngineDescription': 'MySQL Community Edition', 'DBEngineVersionDescription': 'MySQL 5.6.34', 'ValidUpgradeTarget': [{'Engine': 'mysql', 'EngineVersion': '5.6.35', 'Description': 'MySQL 5.6.35', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.6.37', 'Description': 'MySQL 5.6.37', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.6.39', 'Description': 'MySQL 5.6.39', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.6.40', 'Description': 'MySQL 5.6.40', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.7.16', 'Description': 'MySQL 5.7.16', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.17', 'Description': 'MySQL 5.7.17', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.19', 'Description': 'MySQL 5.7.19', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.21', 'Description': 'MySQL 5.7.21', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.22', 'Description': 'MySQL 5.7.22', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}], 'ExportableLogTypes': ['audit', 'error', 'general', 'slowquery'], 'SupportsLogExportsToCloudwatchLogs': True, 'SupportsReadReplica': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.35', 'DBParameterGroupFamily': 'mysql5.6', 'DBEngineDescription': 'MySQL Community Edition', 'DBEngineVersionDescription': 'MySQL 5.6.35', 'ValidUpgradeTarget': [{'Engine': 'mysql', 'EngineVersion': '5.6.37', 'Description': 'MySQL 5.6.37', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.6.39', 'Description': 'MySQL 5.6.39', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.6.40', 'Description': 'MySQL 5.6.40', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.7.16', 'Description': 'MySQL 5.7.16', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.17', 'Description': 'MySQL 5.7.17', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.19', 'Description': 'MySQL 5.7.19', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.21', 'Description': 'MySQL 5.7.21', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.22', 'Description': 'MySQL 5.7.22', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}], 'ExportableLogTypes': ['audit', 'error', 'general', 'slowquery'], 'SupportsLogExportsToCloudwatchLogs': True, 'SupportsReadReplica': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.37', 'DBParameterGroupFamily': 'mysql5.6', 'DBEngineDescription': 'MySQL Community Edition', 'DBEngineVersionDescription': 'mysql 5.6.37', 'ValidUpgradeTarget': [{'Engine': 'mysql', 'EngineVersion': '5.6.39', 'Description': 'MySQL 5.6.39', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.6.40', 'Description': 'MySQL 5.6.40', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.7.16', 'Description': 'MySQL 5.7.16', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.17', 'Description': 'MySQL 5.7.17', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.19', 'Description': 'MySQL 5.7.19', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.21', 'Description': 'MySQL 5.7.21', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.22', 'Description': 'MySQL 5.7.22', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}], 'ExportableLogTypes': ['audit', 'error', 'general', 'slowquery'], 'SupportsLogExportsToCloudwatchLogs': True, 'SupportsReadReplica': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.39', 'DBParameterGroupFamily': 'mysql5.6', 'DBEngineDescription': 'MySQL Community Edition', 'DBEngineVersionDescription': 'mysql 5.6.39', 'ValidUpgradeTarget': [{'Engine': 'mysql', 'EngineVersion': '5.6.40', 'Description': 'MySQL 5.6.40', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.7.16', 'Description': 'MySQL 5.7.16', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.17', 'Description': 'MySQL 5.7.17', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.19', 'Description': 'MySQL 5.7.19', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.21', 'Description': 'MySQL 5.7.21', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.22', 'Description': 'MySQL 5.7.22', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}], 'ExportableLogTypes': ['audit', 'error', 'general', 'slowquery'], 'SupportsLogExportsToCloudwatchLogs': True, 'SupportsReadReplica': True}, {'Engine': 'mysql', 'EngineVersion': '5.6.40', 'DBParameterGroupFamily': 'mysql5.6', 'DBEngineDescription': 'MySQL Community Edition', 'DBEngineVersionDescription': 'MySQL 5.6.40', 'ValidUpgradeTarget': [{'Engine': 'mysql', 'EngineVersion': '5.7.22', 'Description': 'MySQL 5.7.22', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}], 'ExportableLogTypes': ['audit', 'error', 'general', 'slowquery'], 'SupportsLogExportsToCloudwatchLogs': True, 'SupportsReadReplica': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.16', 'DBParameterGroupFamily': 'mysql5.7', 'DBEngineDescription': 'MySQL Community Edition', 'DBEngineVersionDescription': 'MySQL 5.7.16', 'ValidUpgradeTarget': [{'Engine': 'mysql', 'EngineVersion': '5.7.17', 'Description': 'MySQL 5.7.17', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.7.19', 'Description': 'MySQL 5.7.19', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.7.21', 'Description': 'MySQL 5.7.21', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.7.22', 'Description': 'MySQL 5.7.22', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}], 'ExportableLogTypes': ['audit', 'error', 'general', 'slowquery'], 'SupportsLogExportsToCloudwatchLogs': True, 'SupportsReadReplica': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.17', 'DBParameterGroupFamily': 'mysql5.7', 'DBEngineDescription': 'MySQL Community Edition', 'DBEngineVersionDescription': 'MySQL 5.7.17', 'ValidUpgradeTarget': [{'Engine': 'mysql', 'EngineVersion': '5.7.19', 'Description': 'MySQL 5.7.19', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.7.21', 'Description': 'MySQL 5.7.21', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.7.22', 'Description': 'MySQL 5.7.22', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}], 'ExportableLogTypes': ['audit', 'error', 'general', 'slowquery'], 'SupportsLogExportsToCloudwatchLogs': True, 'SupportsReadReplica': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.19', 'DBParameterGroupFamily': 'mysql5.7', 'DBEngineDescription': 'MySQL Community Edition', 'DBEngineVersionDescription': 'mysql 5.7.19', 'ValidUpgradeTarget': [{'Engine': 'mysql', 'EngineVersion': '5.7.21', 'Description': 'MySQL 5.7.21', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}, {'Engine': 'mysql', 'EngineVersion': '5.7.22', 'Description': 'MySQL 5.7.22', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}], 'ExportableLogTypes': ['audit', 'error', 'general', 'slowquery'], 'SupportsLogExportsToCloudwatchLogs': True, 'SupportsReadReplica': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.21', 'DBParameterGroupFamily': 'mysql5.7', 'DBEngineDescription': 'MySQL Community Edition', 'DBEngineVersionDescription': 'mysql 5.7.21', 'ValidUpgradeTarget': [{'Engine': 'mysql', 'EngineVersion': '5.7.22', 'Description': 'MySQL 5.7.22', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': False}], 'ExportableLogTypes': ['audit', 'error', 'general', 'slowquery'], 'SupportsLogExportsToCloudwatchLogs': True, 'SupportsReadReplica': True}, {'Engine': 'mysql', 'EngineVersion': '5.7.22', 'DBParameterGroupFamily': 'mysql5.7', 'DBEngineDescription': 'MySQL Community Edition', 'DBEngineVersionDescription': 'MySQL 5.7.22', 'ValidUpgradeTarget': [], 'ExportableLogTypes': ['audit', 'error', 'general', 'slowquery'], 'SupportsLogExportsToCloudwatchLogs': True, 'SupportsReadReplica': True}], 'ResponseMetadata': {'RequestId': '20f6acf6-46a7-43db-b7c1-dde13d911d8b', 'HTTPStatusCode': 200, 'HTTPHeaders': {'x-amzn-requestid': '20f6acf6-46a7-43db-b7c1-dde13d911d8b', 'content-type': 'text/xml', 'content-length': '57505', 'vary': 'Accept-Encoding', 'date': 'Fri, 28 Sep 2018 15:55:02 GMT'}, 'RetryAttempts': 0}}, {'DBEngineVersions': [{'Engine': 'mysql', 'EngineVersion': '5.6.40', 'DBParameterGroupFamily': 'mysql5.6', 'DBEngineDescription': 'MySQL Community Edition', 'DBEngineVersionDescription': 'MySQL 5.6.40', 'ValidUpgradeTarget': [{'Engine': 'mysql', 'EngineVersion': '5.7.22', 'Description': 'MySQL 5.7.22', 'AutoUpgrade': False, 'IsMajorVersionUpgrade': True}], 'ExportableLogTypes': ['audit', 'error', 'general', 'slowquery'], 'SupportsLogExportsToCloudwatchLogs': True, 'SupportsReadReplica': True}], 'ResponseMetadata': {'RequestId': '0d7b3ab9-9879-4e69-a7b0-f4625e78aba8', 'HTTPStatusCode': 200, 'HTTPHeaders': {'x-amzn-requestid': '0d7b3ab9-9879-4e69-a7b0-f4625e78aba8', 'content-type': 'text/xml', 'content-length': '1638', 'date': 'Sat, 29 Sep 2018 02:04:50 GMT'}, 'RetryAttempts': 0}}, {'DBEngineVersions': [{'Engine': 'mysql', 'EngineVersion': '5.7.22', 'DBParameterGroupFamily': 'mysql5.7', 'DBEngineDescription': 'MySQL Community Edition', 'DBEngineVersionDescription': 'MySQL 5.7.22', 'ValidUpgradeTarget': [], 'ExportableLogTypes': ['audit', 'error', 'general', 'slowquery'], 'SupportsLogExportsToCloudwatchLogs': True, 'SupportsReadReplica': True}], 'ResponseMetadata': {'RequestId': '951ae563-e0b2-48f5-a920-d4d81119ce68', 'HTTPStatusCode': 200, 'HTTPHeaders': {'x-amzn-requestid': '951ae563-e0b2-48f5-a920-d4d81119ce68', 'content-type': 'text/xml', 'content-length': '1197', 'date': 'Sat, 29 Sep 2018 02:05:45 GMT'}, 'RetryAttempts': 0}}
 ]
 
+def describe_db_engine_versions(Engine=None, EngineVersion=None, **kwargs):
+    for describe_db_engine_versions_response in (
+        describe_postgres_db_engine_versions + describe_mysql_db_engine_versions
+    ):
+        db_engine_version = describe_db_engine_versions_response['DBEngineVersions'][0]
+        if (db_engine_version['Engine'] == Engine and
+                db_engine_version['EngineVersion'] == EngineVersion):
+            return describe_db_engine_versions_response
+    return {'DBEngineVersions': []}
+
 def describe_db_instances(status=None):
     describe_db_instances_response = {'DBInstances': [{'DBInstanceIdentifier': 'test-rds-id', 'DBInstanceClass': 'db.t2.small', 'Engine': 'postgres', 'DBInstanceStatus': 'available', 'MasterUsername': 'None', 'DBName': 'test-rds-name', 'Endpoint': {'Address': 'test-rds-id.aaaaaaaaaa.us-east-1.rds.amazonaws.com', 'Port': 5432}, 'AllocatedStorage': 10, 'PreferredBackupWindow': '03:50-04:20', 'BackupRetentionPeriod': 1, 'DBSecurityGroups': [], 'VpcSecurityGroups': [], 'DBParameterGroups': [{'DBParameterGroupName': 'default.postgres9.3', 'ParameterApplyStatus': 'in-sync'}], 'PreferredMaintenanceWindow': 'wed:06:38-wed:07:08', 'MultiAZ': False, 'EngineVersion': '9.3.14', 'AutoMinorVersionUpgrade': False, 'ReadReplicaDBInstanceIdentifiers': [], 'LicenseModel': 'None', 'OptionGroupMemberships': [], 'PubliclyAccessible': False, 'StatusInfos': [], 'StorageType': 'standard', 'StorageEncrypted': False, 'DbiResourceId': 'db-M5ENSHXFPU6XHZ4G4ZEI5QIO2U', 'DBInstanceArn': 'arn:aws:rds:us-east-1:1234567890:db:test-rds-id', 'IAMDatabaseAuthenticationEnabled': False}], 'ResponseMetadata': {'RequestId': '523e3218-afc7-11c3-90f5-f90431260ab4', 'HTTPStatusCode': 200, 'HTTPHeaders': {'Content-Type': 'text/plain', 'server': 'amazon.com'}, 'RetryAttempts': 0}}
     describe_db_instances_response["DBInstances"][0]["DBInstanceStatus"] = status
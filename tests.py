@@ -1,12 +1,13 @@
 import doctest
 import json
+import threading
 import unittest
 from unittest import mock
 
 import boto3
 from moto import mock_rds2
 
-from models import RDSUpgrader, rds_client
+from models import RDSInstance, RDSUpgrader, rds_client
 from test_data.fixtures import (
     list_tags_for_resource,
     describe_postgres_db_engine_versions,
@@ -17,9 +18,33 @@ from test_data.fixtures import (
     test_instance_owner_value,
     test_tags,
     describe_db_instances,
+    describe_db_engine_versions,
 )
 from test_data.utils import make_rds_instance
-from upgrade import create_parser
+from upgrade import create_parser, parse_args
+
+
+def record_upgrade_hops(upgrade_hops, concurrent_instance_ids=()):
+    """
+    Build a side_effect for a mocked RDSInstance._modify_db_to that records
+    each (db_instance_id, engine_version) hop. The first hops of the
+    concurrent_instance_ids wait on each other, so they fail unless those
+    DB Instances are upgraded concurrently.
+    """
+    barrier = threading.Barrier(len(concurrent_instance_ids) or 1)
+    upgraded_instance_ids = set()
+    lock = threading.Lock()
+
+    def _modify_db_to(rds_instance, engine_version):
+        with lock:
+            is_first_hop = rds_instance.db_instance_id not in upgraded_instance_ids
+            upgraded_instance_ids.add(rds_instance.db_instance_id)
+        if is_first_hop and rds_instance.db_instance_id in concurrent_instance_ids:
+            barrier.wait(timeout=5)
+        with lock:
+            upgrade_hops.append((rds_instance.db_instance_id, engine_version))
+
+    return _modify_db_to
 
 
 @mock_rds2
@@ -45,7 +70,7 @@ class RDSInstanceTests(unittest.TestCase):
 @mock.patch.object(
     rds_client,
     "describe_db_engine_versions",
-    side_effect=describe_postgres_db_engine_versions,
+    side_effect=describe_db_engine_versions,
 )
 @mock.patch("time.sleep")
 class RDSUpgraderTests(unittest.TestCase):
@@ -82,9 +107,12 @@ class RDSUpgraderTests(unittest.TestCase):
         instance_ids_to_upgrade = [test_instance_id, another_instance_id]
         rds_upgrader = RDSUpgrader(ids=instance_ids_to_upgrade)
         rds_upgrader.upgrade_all()
+        # Instances sharing an engine version resolve their upgrade path once,
+        # and each hop of their shared upgrade path is validated once
         self.assertEqual(
             describe_db_engine_versions_mock.call_count,
-            len(describe_postgres_db_engine_versions) * len(instance_ids_to_upgrade),
+            len(describe_postgres_db_engine_versions)
+            + len(rds_upgrader.rds_instances[0].upgrade_path),
         )
         for rds_instance in rds_upgrader.rds_instances:
             self.assertEqual(rds_instance.engine_version, "10.4")
@@ -192,13 +220,530 @@ class RDSUpgraderTests(unittest.TestCase):
             "9.3.14",
         )
 
+    def test_upgrade_read_replicas_before_their_source(
+        self, sleep_mock, describe_db_engine_versions_mock
+    ):
+        source_instance_id = "mysql-source-id"
+        read_replica_id = "mysql-read-replica-id"
+        self.rds_client.create_db_instance(
+            AllocatedStorage=10,
+            DBInstanceIdentifier=source_instance_id,
+            DBInstanceClass="db.t2.small",
+            Engine="mysql",
+            EngineVersion="5.5.46",
+        )
+        self.rds_client.create_db_instance_read_replica(
+            DBInstanceIdentifier=read_replica_id,
+            SourceDBInstanceIdentifier=source_instance_id,
+        )
+        upgrade_hops = []
+        with mock.patch.object(
+            RDSInstance,
+            "_modify_db_to",
+            autospec=True,
+            side_effect=lambda rds_instance, engine_version: upgrade_hops.append(
+                (rds_instance.db_instance_id, engine_version)
+            ),
+        ):
+            RDSUpgrader(ids=[source_instance_id, read_replica_id]).upgrade_all()
+        self.assertEqual(
+            upgrade_hops,
+            [
+                (read_replica_id, "5.6.40"),
+                (source_instance_id, "5.6.40"),
+                (read_replica_id, "5.7.22"),
+                (source_instance_id, "5.7.22"),
+            ],
+        )
+        self.rds_client.delete_db_instance(DBInstanceIdentifier=read_replica_id)
+        self.rds_client.delete_db_instance(DBInstanceIdentifier=source_instance_id)
+
+    def test_sibling_read_replicas_upgraded_concurrently(
+        self, sleep_mock, describe_db_engine_versions_mock
+    ):
+        source_instance_id = "mysql-source-id"
+        read_replica_ids = ["mysql-read-replica-a", "mysql-read-replica-b"]
+        self.rds_client.create_db_instance(
+            AllocatedStorage=10,
+            DBInstanceIdentifier=source_instance_id,
+            DBInstanceClass="db.t2.small",
+            Engine="mysql",
+            EngineVersion="5.5.46",
+        )
+        for read_replica_id in read_replica_ids:
+            self.rds_client.create_db_instance_read_replica(
+                DBInstanceIdentifier=read_replica_id,
+                SourceDBInstanceIdentifier=source_instance_id,
+            )
+        upgrade_hops = []
+        with mock.patch.object(
+            RDSInstance,
+            "_modify_db_to",
+            autospec=True,
+            side_effect=record_upgrade_hops(
+                upgrade_hops, concurrent_instance_ids=read_replica_ids
+            ),
+        ):
+            RDSUpgrader(ids=[source_instance_id] + read_replica_ids).upgrade_all()
+        self.assertEqual(
+            sorted(upgrade_hops[:2]),
+            [(read_replica_id, "5.6.40") for read_replica_id in read_replica_ids],
+        )
+        self.assertEqual(upgrade_hops[2], (source_instance_id, "5.6.40"))
+        self.assertEqual(
+            sorted(upgrade_hops[3:5]),
+            [(read_replica_id, "5.7.22") for read_replica_id in read_replica_ids],
+        )
+        self.assertEqual(upgrade_hops[5:], [(source_instance_id, "5.7.22")])
+        for read_replica_id in read_replica_ids:
+            self.rds_client.delete_db_instance(DBInstanceIdentifier=read_replica_id)
+        self.rds_client.delete_db_instance(DBInstanceIdentifier=source_instance_id)
+
+    def test_independent_replica_sets_upgraded_concurrently(
+        self, sleep_mock, describe_db_engine_versions_mock
+    ):
+        another_instance_id = "another_instance_id"
+        self.rds_client.create_db_instance(
+            AllocatedStorage=10,
+            DBInstanceIdentifier=another_instance_id,
+            DBInstanceClass="db.t2.small",
+            Engine="postgres",
+            EngineVersion="9.3.14",
+        )
+        upgrade_hops = []
+        with mock.patch.object(
+            RDSInstance,
+            "_modify_db_to",
+            autospec=True,
+            side_effect=record_upgrade_hops(
+                upgrade_hops,
+                concurrent_instance_ids=[test_instance_id, another_instance_id],
+            ),
+        ):
+            RDSUpgrader(ids=[test_instance_id, another_instance_id]).upgrade_all()
+        self.assertEqual(
+            sorted(upgrade_hops),
+            sorted(
+                (db_instance_id, engine_version)
+                for db_instance_id in [test_instance_id, another_instance_id]
+                for engine_version in ["9.4.18", "9.5.13", "9.6.9", "10.4"]
+            ),
+        )
+        self.rds_client.delete_db_instance(DBInstanceIdentifier=another_instance_id)
+
+    def test_source_not_upgraded_without_its_read_replicas(
+        self, sleep_mock, describe_db_engine_versions_mock
+    ):
+        source_instance_id = "mysql-source-id"
+        read_replica_id = "mysql-read-replica-id"
+        self.rds_client.create_db_instance(
+            AllocatedStorage=10,
+            DBInstanceIdentifier=source_instance_id,
+            DBInstanceClass="db.t2.small",
+            Engine="mysql",
+            EngineVersion="5.5.46",
+        )
+        self.rds_client.create_db_instance_read_replica(
+            DBInstanceIdentifier=read_replica_id,
+            SourceDBInstanceIdentifier=source_instance_id,
+        )
+        with mock.patch.object(
+            RDSInstance, "_modify_db_to", autospec=True
+        ) as modify_db_to_mock:
+            rds_upgrader = RDSUpgrader(ids=[source_instance_id])
+            rds_upgrader.upgrade_all()
+        self.assertEqual(len(rds_upgrader.rds_instances), 0)
+        self.assertEqual(modify_db_to_mock.call_count, 0)
+        self.rds_client.delete_db_instance(DBInstanceIdentifier=read_replica_id)
+        self.rds_client.delete_db_instance(DBInstanceIdentifier=source_instance_id)
+
+    def test_source_upgraded_if_read_replicas_already_at_target_version(
+        self, *args
+    ):
+        source_instance_id = "mysql-source-id"
+        read_replica_id = "mysql-read-replica-id"
+        self.rds_client.create_db_instance(
+            AllocatedStorage=10,
+            DBInstanceIdentifier=source_instance_id,
+            DBInstanceClass="db.t2.small",
+            Engine="mysql",
+            EngineVersion="5.5.46",
+        )
+        self.rds_client.create_db_instance_read_replica(
+            DBInstanceIdentifier=read_replica_id,
+            SourceDBInstanceIdentifier=source_instance_id,
+        )
+        self.rds_client.modify_db_instance(
+            DBInstanceIdentifier=read_replica_id, EngineVersion="5.6.40"
+        )
+        upgrade_hops = []
+        with mock.patch.object(
+            RDSInstance,
+            "_modify_db_to",
+            autospec=True,
+            side_effect=record_upgrade_hops(upgrade_hops),
+        ):
+            RDSUpgrader(
+                ids=[source_instance_id, read_replica_id], target_version="5.6.40"
+            ).upgrade_all()
+        self.assertEqual(upgrade_hops, [(source_instance_id, "5.6.40")])
+        self.rds_client.delete_db_instance(DBInstanceIdentifier=read_replica_id)
+        self.rds_client.delete_db_instance(DBInstanceIdentifier=source_instance_id)
+
+    def test_postgres_read_replicas_upgraded_with_their_source(
+        self, sleep_mock, describe_db_engine_versions_mock
+    ):
+        read_replica_id = "postgres-read-replica-id"
+        self.rds_client.create_db_instance_read_replica(
+            DBInstanceIdentifier=read_replica_id,
+            SourceDBInstanceIdentifier=test_instance_id,
+        )
+        with mock.patch.object(
+            RDSInstance, "_modify_db_to", autospec=True
+        ) as modify_db_to_mock:
+            RDSUpgrader(ids=[test_instance_id, read_replica_id]).upgrade_all()
+        self.assertEqual(
+            [
+                rds_instance.db_instance_id
+                for (rds_instance, _), _ in modify_db_to_mock.call_args_list
+            ],
+            [test_instance_id] * 4,
+        )
+        self.rds_client.delete_db_instance(DBInstanceIdentifier=read_replica_id)
+
+    def test_postgres_read_replica_alone_not_upgraded(self, *args):
+        read_replica_id = "postgres-read-replica-id"
+        self.rds_client.create_db_instance_read_replica(
+            DBInstanceIdentifier=read_replica_id,
+            SourceDBInstanceIdentifier=test_instance_id,
+        )
+        with mock.patch.object(
+            RDSInstance, "_modify_db_to", autospec=True
+        ) as modify_db_to_mock:
+            rds_upgrader = RDSUpgrader(ids=[read_replica_id])
+            rds_upgrader.upgrade_all()
+        self.assertEqual(modify_db_to_mock.call_count, 0)
+        self.assertEqual(rds_upgrader.get_dry_run_info(), "")
+        self.rds_client.delete_db_instance(DBInstanceIdentifier=read_replica_id)
+
+    def test_upgrade_in_waves(self, sleep_mock, describe_db_engine_versions_mock):
+        another_instance_id = "another_instance_id"
+        self.rds_client.create_db_instance(
+            AllocatedStorage=10,
+            DBInstanceIdentifier=another_instance_id,
+            DBInstanceClass="db.t2.small",
+            Engine="postgres",
+            EngineVersion="9.3.14",
+        )
+        args = create_parser().parse_args(
+            [
+                "-ids",
+                test_instance_id,
+                another_instance_id,
+                "-waves",
+                '{"stage": "canary"}',
+                "-c",
+                "1",
+            ]
+        )
+        rds_upgrader = RDSUpgrader(ids=args.rds_db_instance_ids)
+        upgrade_hops = []
+        with mock.patch.object(
+            RDSUpgrader,
+            "_get_db_instance_ids_from_tags",
+            return_value=[another_instance_id],
+        ), mock.patch.object(
+            RDSInstance,
+            "_modify_db_to",
+            autospec=True,
+            side_effect=lambda rds_instance, engine_version: upgrade_hops.append(
+                rds_instance.db_instance_id
+            ),
+        ):
+            rds_upgrader.upgrade_all(
+                wave_tags=args.wave_tags, concurrency=args.concurrency
+            )
+        self.assertEqual(
+            upgrade_hops, [another_instance_id] * 4 + [test_instance_id] * 4
+        )
+        self.rds_client.delete_db_instance(DBInstanceIdentifier=another_instance_id)
+
+    def test_every_wave_starts_with_a_canary_batch(self, *args):
+        other_instance_ids = ["instance-b", "instance-c", "instance-d"]
+        for db_instance_id in other_instance_ids:
+            self.rds_client.create_db_instance(
+                AllocatedStorage=10,
+                DBInstanceIdentifier=db_instance_id,
+                DBInstanceClass="db.t2.small",
+                Engine="postgres",
+                EngineVersion="9.3.14",
+            )
+        rds_upgrader = RDSUpgrader(ids=[test_instance_id] + other_instance_ids)
+        last_instance_started = threading.Event()
+        overlapped = []
+
+        def _modify_db_to(rds_instance, engine_version):
+            if rds_instance.db_instance_id == "instance-d":
+                last_instance_started.set()
+            elif (rds_instance.db_instance_id == "instance-c" and
+                    engine_version == "9.4.18"):
+                overlapped.append(last_instance_started.wait(timeout=1))
+
+        with mock.patch.object(
+            RDSUpgrader,
+            "_get_db_instance_ids_from_tags",
+            return_value=[test_instance_id, "instance-b"],
+        ), mock.patch.object(
+            RDSInstance, "_modify_db_to", autospec=True, side_effect=_modify_db_to
+        ):
+            rds_upgrader.upgrade_all(wave_tags=[{"stage": "one"}], concurrency=1)
+        # The second wave's canary batch only holds instance-c, even though
+        # the first wave ramped the concurrency up
+        self.assertEqual(overlapped, [False])
+        self.assertTrue(last_instance_started.is_set())
+        for db_instance_id in other_instance_ids:
+            self.rds_client.delete_db_instance(DBInstanceIdentifier=db_instance_id)
+
+    def test_upgrade_started_as_soon_as_another_finishes(self, *args):
+        other_instance_ids = ["instance-a", "instance-b", "instance-c"]
+        for db_instance_id in other_instance_ids:
+            self.rds_client.create_db_instance(
+                AllocatedStorage=10,
+                DBInstanceIdentifier=db_instance_id,
+                DBInstanceClass="db.t2.small",
+                Engine="postgres",
+                EngineVersion="9.3.14",
+            )
+        rds_upgrader = RDSUpgrader(ids=[test_instance_id] + other_instance_ids)
+        last_instance_started = threading.Event()
+        waits = []
+
+        def _modify_db_to(rds_instance, engine_version):
+            if rds_instance.db_instance_id == "instance-c":
+                last_instance_started.set()
+            elif (rds_instance.db_instance_id == "instance-a" and
+                    engine_version == "9.4.18"):
+                waits.append(last_instance_started.wait(timeout=5))
+
+        with mock.patch.object(
+            RDSInstance, "_modify_db_to", autospec=True, side_effect=_modify_db_to
+        ):
+            rds_upgrader.upgrade_all(concurrency=1)
+        # After the canary, instance-a and instance-b are started. instance-c
+        # has to start once instance-b finishes, while instance-a still runs
+        self.assertEqual(waits, [True])
+        for db_instance_id in other_instance_ids:
+            self.rds_client.delete_db_instance(DBInstanceIdentifier=db_instance_id)
+
+    def test_failing_canary_halts_rollout(
+        self, sleep_mock, describe_db_engine_versions_mock
+    ):
+        other_instance_ids = ["another_instance_id", "yet_another_instance_id"]
+        for db_instance_id in other_instance_ids:
+            self.rds_client.create_db_instance(
+                AllocatedStorage=10,
+                DBInstanceIdentifier=db_instance_id,
+                DBInstanceClass="db.t2.small",
+                Engine="postgres",
+                EngineVersion="9.3.14",
+            )
+        rds_upgrader = RDSUpgrader(ids=[test_instance_id] + other_instance_ids)
+        with mock.patch.object(
+            RDSInstance,
+            "_modify_db_to",
+            autospec=True,
+            side_effect=RuntimeError("Bad version hop"),
+        ) as modify_db_to_mock:
+            rds_upgrader.upgrade_all(concurrency=1)
+        self.assertEqual(modify_db_to_mock.call_count, 1)
+        for db_instance_id in other_instance_ids:
+            self.rds_client.delete_db_instance(DBInstanceIdentifier=db_instance_id)
+
+    def test_upgrade_concurrency_clamped_to_max_concurrency(self, *args):
+        rds_upgrader = RDSUpgrader(ids=[test_instance_id])
+        with mock.patch.object(
+            RDSUpgrader, "_upgrade_wave", return_value=False
+        ) as upgrade_wave_mock:
+            rds_upgrader.upgrade_all(concurrency=4, max_concurrency=2)
+        self.assertEqual(upgrade_wave_mock.call_args[1]["concurrency"], 2)
+
+    def test_upgrade_concurrency_must_be_positive(self, *args):
+        rds_upgrader = RDSUpgrader(ids=[test_instance_id])
+        for kwargs in [{"concurrency": 0}, {"concurrency": 1, "max_concurrency": -1}]:
+            with self.assertRaises(ValueError):
+                rds_upgrader.upgrade_all(**kwargs)
+
+    def test_upgrade_groups_upgraded_concurrently(self, *args):
+        another_instance_id = "another_instance_id"
+        self.rds_client.create_db_instance(
+            AllocatedStorage=10,
+            DBInstanceIdentifier=another_instance_id,
+            DBInstanceClass="db.t2.small",
+            Engine="mysql",
+            EngineVersion="5.5.46",
+        )
+        rds_upgrader = RDSUpgrader(ids=[test_instance_id, another_instance_id])
+        self.assertEqual(
+            len(rds_upgrader._get_upgrade_groups(rds_upgrader.rds_instances)), 2
+        )
+        upgrade_hops = []
+        with mock.patch.object(
+            RDSInstance,
+            "_modify_db_to",
+            autospec=True,
+            side_effect=record_upgrade_hops(
+                upgrade_hops,
+                concurrent_instance_ids=[test_instance_id, another_instance_id],
+            ),
+        ):
+            rds_upgrader.upgrade_all()
+        self.assertEqual(
+            sorted(upgrade_hops),
+            [
+                (another_instance_id, "5.6.40"),
+                (another_instance_id, "5.7.22"),
+                (test_instance_id, "10.4"),
+                (test_instance_id, "9.4.18"),
+                (test_instance_id, "9.5.13"),
+                (test_instance_id, "9.6.9"),
+            ],
+        )
+        self.rds_client.delete_db_instance(DBInstanceIdentifier=another_instance_id)
+
+    def test_upgrade_group_with_invalid_upgrade_path_not_upgraded(
+        self, sleep_mock, describe_db_engine_versions_mock
+    ):
+        another_instance_id = "another_instance_id"
+        self.rds_client.create_db_instance(
+            AllocatedStorage=10,
+            DBInstanceIdentifier=another_instance_id,
+            DBInstanceClass="db.t2.small",
+            Engine="postgres",
+            EngineVersion="9.5.13",
+        )
+        rds_upgrader = RDSUpgrader(ids=[test_instance_id, another_instance_id])
+
+        def describe_deprecated_db_engine_versions(**kwargs):
+            if kwargs["EngineVersion"] == "9.3.14":
+                # 9.4.18 got deprecated since the upgrade paths were planned
+                return {"DBEngineVersions": []}
+            return describe_db_engine_versions(**kwargs)
+
+        describe_db_engine_versions_mock.side_effect = (
+            describe_deprecated_db_engine_versions
+        )
+        upgrade_hops = []
+        with mock.patch.object(
+            RDSInstance,
+            "_modify_db_to",
+            autospec=True,
+            side_effect=record_upgrade_hops(upgrade_hops),
+        ):
+            rds_upgrader.upgrade_all()
+        self.assertEqual(
+            upgrade_hops,
+            [(another_instance_id, "9.6.9"), (another_instance_id, "10.4")],
+        )
+        self.rds_client.delete_db_instance(DBInstanceIdentifier=another_instance_id)
+
+    def test_read_replica_set_with_invalid_read_replica_hops_not_upgraded(
+        self, sleep_mock, describe_db_engine_versions_mock
+    ):
+        source_instance_id = "mysql-source-id"
+        read_replica_id = "mysql-read-replica-id"
+        self.rds_client.create_db_instance(
+            AllocatedStorage=10,
+            DBInstanceIdentifier=source_instance_id,
+            DBInstanceClass="db.t2.small",
+            Engine="mysql",
+            EngineVersion="5.5.46",
+        )
+        self.rds_client.create_db_instance_read_replica(
+            DBInstanceIdentifier=read_replica_id,
+            SourceDBInstanceIdentifier=source_instance_id,
+        )
+        self.rds_client.modify_db_instance(
+            DBInstanceIdentifier=read_replica_id, EngineVersion="5.5.53"
+        )
+        read_replica_engine_versions = {
+            "DBEngineVersions": [
+                {
+                    "Engine": "mysql",
+                    "EngineVersion": "5.5.53",
+                    "ValidUpgradeTarget": [
+                        {
+                            "Engine": "mysql",
+                            "EngineVersion": "5.6.40",
+                            "IsMajorVersionUpgrade": True,
+                        }
+                    ],
+                }
+            ]
+        }
+
+        def describe_planned_db_engine_versions(**kwargs):
+            if kwargs["EngineVersion"] == "5.5.53":
+                return read_replica_engine_versions
+            return describe_db_engine_versions(**kwargs)
+
+        describe_db_engine_versions_mock.side_effect = (
+            describe_planned_db_engine_versions
+        )
+        rds_upgrader = RDSUpgrader(ids=[source_instance_id, read_replica_id])
+        # 5.6.40 is no longer a valid upgrade target of the read replica's
+        # 5.5.53, though it still is of the source's 5.5.46
+        read_replica_engine_versions["DBEngineVersions"] = []
+        with mock.patch.object(
+            RDSInstance, "_modify_db_to", autospec=True
+        ) as modify_db_to_mock:
+            rds_upgrader.upgrade_all()
+        self.assertEqual(modify_db_to_mock.call_count, 0)
+        self.rds_client.delete_db_instance(DBInstanceIdentifier=read_replica_id)
+        self.rds_client.delete_db_instance(DBInstanceIdentifier=source_instance_id)
+
     def test_get_dry_run_info(self, *args):
         rds_upgrader = RDSUpgrader(ids=[test_instance_id])
         self.assertEqual(
             rds_upgrader.get_dry_run_info(),
-            "RDSInstance: {} will be upgraded as follows: 9.4.18 -> 9.5.13 -> 9.6.9 -> 10.4\n"
-            .format(test_instance_id)
+            "postgres 9.3.14 -> 9.4.18 -> 9.5.13 -> 9.6.9 -> 10.4: "
+            "1 RDSInstance(s) ({})\n".format(test_instance_id)
+        )
+
+    def test_get_dry_run_info_groups_identical_upgrade_paths(self, *args):
+        another_instance_id = "another_instance_id"
+        self.rds_client.create_db_instance(
+            AllocatedStorage=10,
+            DBInstanceIdentifier=another_instance_id,
+            DBInstanceClass="db.t2.small",
+            Engine="postgres",
+            EngineVersion="9.3.14",
+        )
+        rds_upgrader = RDSUpgrader(ids=[test_instance_id, another_instance_id])
+        self.assertEqual(
+            rds_upgrader.get_dry_run_info(),
+            "postgres 9.3.14 -> 9.4.18 -> 9.5.13 -> 9.6.9 -> 10.4: "
+            "2 RDSInstance(s) ({}, {})\n".format(test_instance_id, another_instance_id)
         )
+        self.rds_client.delete_db_instance(DBInstanceIdentifier=another_instance_id)
+
+
+class ParseArgsTests(unittest.TestCase):
+    def test_concurrency_args(self):
+        args = parse_args(
+            ["-ids", test_instance_id, "-c", "2", "--max_concurrency", "8"]
+        )
+        self.assertEqual((args.concurrency, args.max_concurrency), (2, 8))
+
+    @mock.patch("sys.stderr")
+    def test_invalid_concurrency_args_rejected(self, stderr_mock):
+        for concurrency_args in [
+            ["-c", "0"],
+            ["-c", "-1"],
+            ["-c", "1", "--max_concurrency", "0"],
+            ["--max_concurrency", "4"],
+        ]:
+            with self.assertRaises(SystemExit):
+                parse_args(["-ids", test_instance_id] + concurrency_args)
 
 
 class DocTests(unittest.TestCase):
@@ -4,6 +4,15 @@ import json
 from models import RDSUpgrader
 
 
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(
+            "{} is not a positive integer".format(value)
+        )
+    return number
+
+
 def create_parser():
     parser = argparse.ArgumentParser(description="Gather RDSUpgrader configurables.")
     db_instance_id_group = parser.add_mutually_exclusive_group(required=True)
@@ -26,6 +35,25 @@ def create_parser():
         type=str,
         help="Major DBEngineVersion to target for the upgrade",
     )
+    parser.add_argument(
+        "-waves",
+        "--wave_tags",
+        type=json.loads,
+        nargs="+",
+        help="Tags of RDS DBInstances to upgrade in each wave, in order",
+    )
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=positive_int,
+        help="Number of RDS DBInstances (and their read replicas) to upgrade "
+        "in the first batch. Doubles while upgrades succeed",
+    )
+    parser.add_argument(
+        "--max_concurrency",
+        type=positive_int,
+        help="Upper bound for the number of RDS DBInstances to upgrade at once",
+    )
     parser.add_argument(
         "-dry",
         "--dry_run",
@@ -35,8 +63,16 @@ def create_parser():
     return parser
 
 
+def parse_args(argv=None):
+    parser = create_parser()
+    args = parser.parse_args(argv)
+    if args.max_concurrency is not None and args.concurrency is None:
+        parser.error("--max_concurrency requires -c/--concurrency")
+    return args
+
+
 def main():
-    args = create_parser().parse_args()
+    args = parse_args()
     rds_upgrader = RDSUpgrader(
         ids=args.rds_db_instance_ids,
         tags=args.rds_db_instance_tags,
@@ -44,7 +80,11 @@ def main():
     )
 
     if not args.dry_run:
-        rds_upgrader.upgrade_all()
+        rds_upgrader.upgrade_all(
+            wave_tags=args.wave_tags,
+            concurrency=args.concurrency,
+            max_concurrency=args.max_concurrency,
+        )
     else:
         print(rds_upgrader.get_dry_run_info())
 
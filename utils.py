@@ -1,17 +1,32 @@
 import sys
 import time
-from threading import Thread
+from threading import Lock, Thread
+
+
+def parse_engine_version(engine_version):
+    """
+    Turn an RDS engine version into a tuple that compares the way engine
+    versions are ordered
+
+    >>> parse_engine_version("9.6.9") < parse_engine_version("10.4")
+    True
+    >>> parse_engine_version("5.6.40") >= parse_engine_version("5.6.40")
+    True
+    """
+    return tuple(int(part) for part in engine_version.split(".") if part.isdigit())
 
 
 class ExceptionCatchingThread(Thread):
     """
     The interface provided by ExceptionCatchingThread is identical to that of
     threading.Thread, however, if an exception occurs in the thread
-    the error will be caught and printed to stderr.
+    the error will be caught, printed to stderr and made available as
+    the `exception` attribute.
     """
 
     def __init__(self, **kwargs):
         super(ExceptionCatchingThread, self).__init__(**kwargs)
+        self.exception = None
         self._real_run = self.run
         self.run = self._wrap_run
 
@@ -19,6 +34,7 @@ class ExceptionCatchingThread(Thread):
         try:
             self._real_run()
         except Exception as exc:
+            self.exception = exc
             print(exc, file=sys.stderr)
 
 
@@ -76,3 +92,43 @@ class RDSWaiter:
                 self.instance_id, self.engine_version
             )
         )
+
+
+class ThrottlingMonitor:
+    """
+    Count the requests of a boto3 client that AWS responded to with a
+    throttling error (each of which botocore will have retried)
+
+    >>> import boto3
+    >>> throttling_monitor = ThrottlingMonitor(boto3.client("rds"))
+    >>> throttling_monitor.count
+    0
+    >>> throttling_monitor._record_throttling(
+    ...    response=(None, {"Error": {"Code": "Throttling"}})
+    ... )
+    >>> throttling_monitor.count
+    1
+    """
+
+    THROTTLING_ERROR_CODES = [
+        "Throttling",
+        "ThrottlingException",
+        "RequestLimitExceeded",
+        "TooManyRequestsException",
+    ]
+
+    def __init__(self, client):
+        self.count = 0
+        self._lock = Lock()
+        client.meta.events.register(
+            "needs-retry.{}".format(client.meta.service_model.service_name),
+            self._record_throttling,
+        )
+
+    def _record_throttling(self, response=None, **kwargs):
+        if response is None:
+            return
+        error_code = response[1].get("Error", {}).get("Code")
+        if error_code in self.THROTTLING_ERROR_CODES:
+            with self._lock:
+                self.count += 1